@@ -7,17 +7,29 @@ It helps developers easily convert inconsistent user inputs (like "yes/no",
 database storage or processing.
 """
 
+from .bulk import SharedMemoryPool
+from .cache import ValidationCache
+from .comparator import find_string_diff
 from .extractor import extract_emails, extract_urls
 from .formatter import convert_case, empty_to_none, mask_email, mask_middle, mask_text, remove_all_whitespace, remove_digits, remove_lines_containing, remove_newlines, remove_punctuation, slugify, str_to_bool
-from .parser import parse_csv
+from .incremental import IncrementalSource, incremental_extract_emails, incremental_parse_csv, incremental_remove_lines_containing
+from .parser import CsvTable, parse_csv
 from .validator import has_digits, is_blank, is_email, is_ip, is_mac_address, is_url, validate_filename
 
 __all__ = [
+    "CsvTable",
+    "IncrementalSource",
+    "SharedMemoryPool",
+    "ValidationCache",
     "convert_case",
     "empty_to_none",
     "extract_emails",
     "extract_urls",
+    "find_string_diff",
     "has_digits",
+    "incremental_extract_emails",
+    "incremental_parse_csv",
+    "incremental_remove_lines_containing",
     "is_blank",
     "is_email",
     "is_ip",
@@ -0,0 +1,239 @@
+import multiprocessing
+import os
+import re
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+
+from .extractor import DEFAULT_EMAIL_PATTERN, RFC5322_EMAIL_PATTERN, URL_PATTERN
+
+# --- Worker Side ---
+EMAIL_PATTERNS = {"default": DEFAULT_EMAIL_PATTERN, "rfc5322": RFC5322_EMAIL_PATTERN}
+
+
+def _email_spans(text: str, mode: str) -> array:
+    spans = array('q')
+    for match in EMAIL_PATTERNS[mode].finditer(text):
+        spans.extend(match.span())
+    return spans
+
+
+def _url_spans(text: str, _: None) -> array:
+    spans = array('q')
+    for match in re.finditer(URL_PATTERN, text):
+        spans.extend(match.span())
+    return spans
+
+
+def _kept_line_spans(text: str, target: str) -> array:
+    spans = array('q')
+    position = 0
+    for line in text.splitlines(keepends=True):
+        content = line.splitlines()[0]
+        if target not in content:
+            spans.extend((position, position + len(content)))
+        position += len(line)
+    return spans
+
+
+OPERATIONS = {"emails": _email_spans, "urls": _url_spans, "kept_lines": _kept_line_spans}
+
+
+def _run_chunk(task: tuple) -> list[tuple[int, array]]:
+    """
+    Runs one operation over a chunk of documents stored in shared memory.
+
+    Only the block name and byte offsets travel to the worker, and only the
+    span arrays travel back.
+    """
+    block_name, operation, argument, documents = task
+    run = OPERATIONS[operation]
+
+    block = shared_memory.SharedMemory(name=block_name)
+    try:
+        return [(index, run(str(block.buf[start:end], 'utf-8'), argument)) for index, start, end in documents]
+    finally:
+        block.close()
+
+
+# --- Pool ---
+class SharedMemoryPool:
+    """
+    A persistent worker pool for running extractors over many large documents.
+
+    Input texts are encoded once into a shared memory block and workers read
+    them in place, so only offsets are pickled on the way in. Each result is an
+    array('q') of flat (start, end) character offsets into the matching input
+    text, so no matched strings are pickled on the way back either.
+
+    Workers stay alive between calls. Documents are grouped into chunks of
+    similar byte size and handed out largest first, one chunk at a time, so
+    busy workers do not hold up idle ones.
+
+    Args:
+        processes (int, optional): Number of worker processes. Defaults to os.cpu_count().
+        chunks_per_process (int, optional): How many chunks to cut per worker
+                                            for load balancing. Defaults to 4.
+
+    Raises:
+        ValueError: If 'processes' or 'chunks_per_process' is smaller than 1.
+
+    Examples:
+        >>> with SharedMemoryPool() as pool:
+        ...     spans = pool.extract_emails(["mail a@b.com now"])[0]
+        >>> [(start, end) for start, end in zip(spans[::2], spans[1::2])]
+        [(5, 12)]
+    """
+
+    def __init__(self, processes: int | None = None, chunks_per_process: int = 4):
+        # --- Input Validation ---
+        if processes is not None and (isinstance(processes, bool) or not isinstance(processes, int) or processes < 1):
+            raise ValueError("Input 'processes' must be a positive integer.")
+        if not isinstance(chunks_per_process, int) or chunks_per_process < 1:
+            raise ValueError("Input 'chunks_per_process' must be a positive integer.")
+
+        # --- Core Logic ---
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if os.name == "posix":
+            # Workers must share the parent's resource tracker, or each one
+            # would unlink the blocks it attached to when it exits.
+            resource_tracker.ensure_running()
+        self._pool = multiprocessing.Pool(processes)
+        self._chunk_count = processes * chunks_per_process
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None and self._pool is not None:
+            self._pool.terminate()
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops the workers once they finish and waits for them to exit.
+        """
+        if self._pool is None:
+            return
+        self._pool.close()
+        self._pool.join()
+        self._pool = None
+
+    def extract_emails(self, texts: list[str], mode: str = "default") -> list[array]:
+        """
+        Finds the email addresses in every text, like extract_emails().
+
+        Args:
+            texts (list[str]): The texts to search.
+            mode (str, optional): 'default' or 'rfc5322'. Defaults to 'default'.
+
+        Returns:
+            list[array]: One array of flat (start, end) offsets per text.
+
+        Raises:
+            TypeError: If any text is not a string.
+            ValueError: If an unknown mode is specified.
+        """
+        # --- Input Validation ---
+        mode = mode.lower()
+        if mode not in EMAIL_PATTERNS:
+            raise ValueError(f"Unknown mode: '{mode}'. Available modes are 'default' and 'rfc5322'.")
+
+        # --- Core Logic ---
+        return self._map("emails", mode, texts)
+
+    def extract_urls(self, texts: list[str]) -> list[array]:
+        """
+        Finds the http and https URLs in every text, like extract_urls().
+
+        Args:
+            texts (list[str]): The texts to search.
+
+        Returns:
+            list[array]: One array of flat (start, end) offsets per text.
+
+        Raises:
+            TypeError: If any text is not a string.
+        """
+        return self._map("urls", None, texts)
+
+    def remove_lines_containing(self, texts: list[str], target: str) -> list[array]:
+        """
+        Finds the lines to keep in every text, like remove_lines_containing().
+
+        Joining the kept lines of a text with "\\n" gives the same result as
+        remove_lines_containing(text, target).
+
+        Args:
+            texts (list[str]): The texts to filter.
+            target (str): Lines containing this substring are dropped.
+
+        Returns:
+            list[array]: One array of flat (start, end) offsets of kept lines per
+                         text, without their line breaks.
+
+        Raises:
+            TypeError: If any text or the target is not a string.
+        """
+        # --- Input Validation ---
+        if not isinstance(target, str):
+            raise TypeError("Input 'target' must be a string")
+
+        # --- Core Logic ---
+        return self._map("kept_lines", target, texts)
+
+    def _map(self, operation: str, argument: str | None, texts: list[str]) -> list[array]:
+        if self._pool is None:
+            raise ValueError("The pool has been closed.")
+
+        encoded_texts = []
+        for text in texts:
+            if not isinstance(text, str):
+                raise TypeError("Every item in 'texts' must be a string.")
+            encoded_texts.append(text.encode('utf-8'))
+        if not encoded_texts:
+            return []
+
+        total_size = sum(len(encoded) for encoded in encoded_texts)
+        block = shared_memory.SharedMemory(create=True, size=max(total_size, 1))
+        try:
+            documents = []
+            position = 0
+            for index, encoded in enumerate(encoded_texts):
+                block.buf[position:position + len(encoded)] = encoded
+                documents.append((index, position, position + len(encoded)))
+                position += len(encoded)
+            del encoded_texts
+
+            tasks = [(block.name, operation, argument, chunk) for chunk in self._make_chunks(documents, total_size)]
+            results = [None] * len(documents)
+            for chunk_results in self._pool.imap_unordered(_run_chunk, tasks):
+                for index, spans in chunk_results:
+                    results[index] = spans
+            return results
+        finally:
+            block.close()
+            block.unlink()
+
+    def _make_chunks(self, documents: list[tuple[int, int, int]], total_size: int) -> list[list[tuple[int, int, int]]]:
+        """
+        Groups consecutive documents into chunks of roughly equal byte size,
+        largest chunk first.
+        """
+        target_size = max(total_size // self._chunk_count, 1)
+
+        chunks = []
+        current_chunk = []
+        current_size = 0
+        for document in documents:
+            current_chunk.append(document)
+            current_size += document[2] - document[1]
+            if current_size >= target_size:
+                chunks.append(current_chunk)
+                current_chunk = []
+                current_size = 0
+        if current_chunk:
+            chunks.append(current_chunk)
+
+        chunks.sort(key=lambda chunk: chunk[-1][2] - chunk[0][1], reverse=True)
+        return chunks
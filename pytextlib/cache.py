@@ -0,0 +1,313 @@
+import hashlib
+import inspect
+import re
+import sqlite3
+import sys
+import time
+from collections import OrderedDict
+
+from . import validator
+from .formatter import mask_email
+from .validator import is_email, is_ip, is_url
+
+# Bump this when the behaviour of a cached function changes in a way that
+# the validator patterns below do not capture (e.g. mask_email's logic).
+CACHE_FORMAT_VERSION = 1
+
+VALIDATORS = {"is_email": is_email, "is_url": is_url, "is_ip": is_ip, "mask_email": mask_email}
+
+# The most results one cache object keeps in memory, on top of 'max_entries'.
+MEMORY_ENTRIES = 100_000
+
+# The number of hashes looked up per SQLite query.
+QUERY_BATCH_SIZE = 500
+
+
+def _patterns_fingerprint() -> str:
+    """
+    Hashes every compiled pattern in validator.py together with the cache
+    format version and the Python version, since is_ip relies on the
+    standard library's ipaddress module.
+    """
+    digest = hashlib.blake2b(f"{CACHE_FORMAT_VERSION}\0{sys.version_info[:2]}\0".encode(), digest_size=16)
+    for name, value in sorted(vars(validator).items()):
+        if isinstance(value, re.Pattern):
+            digest.update(f"{name}\0{value.flags}\0{value.pattern}\0".encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ValidationCache:
+    """
+    A persistent SQLite cache for is_email, is_url, is_ip and mask_email results.
+
+    Each result is stored under the validator name, its options (the 'mode')
+    and a 128-bit hash of the input value, so the values themselves are never
+    written to disk.
+
+    The most recently used results are also kept in memory, up to
+    MEMORY_ENTRIES of them or 'max_entries', whichever is smaller. A value
+    found there only costs a hash and a dictionary lookup, which is cheaper
+    than running the regex again; the other values are looked up in SQLite
+    in batches. Keep one cache object open for a whole job (for example,
+    across all chunks of a table) so repeated values are served from memory.
+    Results evicted or expired by this cache object are dropped from memory
+    too, and expired results are never served.
+
+    'max_entries' is enforced with a count kept by the cache object, so when
+    several processes write to the same file at once, the table can briefly
+    hold more entries than that, or have slightly more evicted than needed.
+
+    The cache clears itself when it is opened with a different version, which
+    is derived from the patterns in validator.py, so editing a pattern
+    invalidates all previous results.
+
+    Args:
+        path (str): The database file. Use ':memory:' for a throwaway cache.
+        ttl (float, optional): Seconds after which an entry is ignored and
+                               removed. Defaults to None (never expires).
+        max_entries (int, optional): The maximum number of stored entries. The
+                                     oldest entries are evicted first.
+                                     Defaults to None (unbounded).
+
+    Raises:
+        ValueError: If 'ttl' or 'max_entries' is not positive.
+
+    Examples:
+        >>> with ValidationCache("validation.db", ttl=7 * 24 * 3600) as cache:
+        ...     cache.validate_many("is_email", ["a@b.com", "nope"])
+        [True, False]
+    """
+
+    def __init__(self, path: str, ttl: float | None = None, max_entries: int | None = None):
+        # --- Input Validation ---
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Input 'ttl' must be positive.")
+        if max_entries is not None and (not isinstance(max_entries, int) or max_entries <= 0):
+            raise ValueError("Input 'max_entries' must be a positive integer.")
+
+        # --- Core Logic ---
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._memory_limit = min(MEMORY_ENTRIES, max_entries or MEMORY_ENTRIES)
+        self._recent_results = OrderedDict()
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "kind TEXT, mode TEXT, value_hash BLOB, result, created_at REAL, "
+                "PRIMARY KEY (kind, mode, value_hash)) WITHOUT ROWID"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS results_created_at ON results (created_at)")
+
+            version = _patterns_fingerprint()
+            row = self._connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if row is None or row[0] != version:
+                self._connection.execute("DELETE FROM results")
+                self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (version,))
+
+            self._count = 0
+            if max_entries is not None:
+                (self._count,) = self._connection.execute("SELECT COUNT(*) FROM results").fetchone()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        self._connection.close()
+
+    def clear(self) -> None:
+        """
+        Removes every cached result.
+        """
+        with self._connection:
+            self._connection.execute("DELETE FROM results")
+        self._count = 0
+        self._recent_results.clear()
+
+    def validate_many(self, kind: str, values: list[str], **options) -> list:
+        """
+        Runs a validator over many values, using cached results where possible.
+
+        Values that miss the cache are validated normally and stored. Errors
+        raised by the validator (such as mask_email's ValueError for an
+        invalid address) are passed through and never cached.
+
+        Args:
+            kind (str): 'is_email', 'is_url', 'is_ip' or 'mask_email'.
+            values (list[str]): The values to validate.
+            **options: Keyword arguments for the validator, e.g. mode='rfc5322'.
+
+        Returns:
+            list: One result per value, as the validator would return it.
+
+        Raises:
+            TypeError: If a value is not a string or an option is unknown.
+            ValueError: If an unknown kind is specified.
+        """
+        results = self.get_many(kind, values, **options)
+        if None not in results:
+            return results
+
+        misses = {}
+        for index, result in enumerate(results):
+            if result is None:
+                misses.setdefault(values[index], []).append(index)
+
+        function = VALIDATORS[kind]
+        computed = [function(value, **options) for value in misses]
+        self.put_many(kind, list(misses), computed, **options)
+
+        for indices, result in zip(misses.values(), computed):
+            for index in indices:
+                results[index] = result
+        return results
+
+    def get_many(self, kind: str, values: list[str], **options) -> list:
+        """
+        Looks up cached results for many values.
+
+        Args:
+            kind (str): 'is_email', 'is_url', 'is_ip' or 'mask_email'.
+            values (list[str]): The values to look up.
+            **options: Keyword arguments the results were computed with.
+
+        Returns:
+            list: One result per value, or None where the cache has no entry.
+
+        Raises:
+            TypeError: If a value is not a string or an option is unknown.
+            ValueError: If an unknown kind is specified.
+        """
+        mode = self._mode(kind, options)
+        value_hashes = self._hash_all(values)
+        cutoff = time.time() - self.ttl if self.ttl is not None else None
+
+        results = [None] * len(value_hashes)
+        misses = {}
+        recent_results = self._recent_results
+        for index, value_hash in enumerate(value_hashes):
+            key = (kind, mode, value_hash)
+            entry = recent_results.get(key)
+            if entry is not None and (cutoff is None or entry[1] >= cutoff):
+                recent_results.move_to_end(key)
+                results[index] = entry[0]
+            else:
+                misses.setdefault(value_hash, []).append(index)
+
+        if misses:
+            for value_hash, result, created_at in self._query(kind, mode, list(misses), cutoff):
+                if kind != "mask_email":
+                    result = bool(result)
+                self._remember((kind, mode, value_hash), result, created_at)
+                for index in misses[value_hash]:
+                    results[index] = result
+        return results
+
+    def put_many(self, kind: str, values: list[str], results: list, **options) -> None:
+        """
+        Stores results for many values, then evicts expired and excess entries.
+
+        Args:
+            kind (str): 'is_email', 'is_url', 'is_ip' or 'mask_email'.
+            values (list[str]): The validated values.
+            results (list): The result for each value.
+            **options: Keyword arguments the results were computed with.
+
+        Raises:
+            TypeError: If a value is not a string or an option is unknown.
+            ValueError: If an unknown kind is specified, or the lists differ in length.
+        """
+        if len(values) != len(results):
+            raise ValueError("Inputs 'values' and 'results' must have the same length.")
+
+        mode = self._mode(kind, options)
+        now = time.time()
+        rows = [(kind, mode, value_hash, result, now) for value_hash, result in zip(self._hash_all(values), results)]
+
+        with self._connection:
+            # Insert new rows first so the running count only grows by the rows that were added.
+            changes = self._connection.total_changes
+            self._connection.executemany("INSERT OR IGNORE INTO results VALUES (?, ?, ?, ?, ?)", rows)
+            added = self._connection.total_changes - changes
+            if added < len(rows):
+                self._connection.executemany(
+                    "UPDATE results SET result = ?, created_at = ? WHERE kind = ? AND mode = ? AND value_hash = ?",
+                    [(row[3], row[4], row[0], row[1], row[2]) for row in rows],
+                )
+            self._count += added
+            for row in rows:
+                self._remember(row[:3], row[3], now)
+
+            if self.ttl is not None:
+                self._forget(self._connection.execute(
+                    "DELETE FROM results WHERE created_at < ? RETURNING kind, mode, value_hash", (now - self.ttl,)
+                ).fetchall())
+
+            if self.max_entries is not None and self._count > self.max_entries:
+                self._forget(self._connection.execute(
+                    "DELETE FROM results WHERE (kind, mode, value_hash) IN "
+                    "(SELECT kind, mode, value_hash FROM results ORDER BY created_at LIMIT ?) "
+                    "RETURNING kind, mode, value_hash",
+                    (self._count - self.max_entries,),
+                ).fetchall())
+
+    def _query(self, kind: str, mode: str, value_hashes: list[bytes], cutoff: float | None) -> list[tuple]:
+        """
+        Reads the stored (value_hash, result, created_at) rows for the given hashes, in batches.
+        """
+        rows = []
+        for start in range(0, len(value_hashes), QUERY_BATCH_SIZE):
+            batch = value_hashes[start:start + QUERY_BATCH_SIZE]
+            query = (
+                "SELECT value_hash, result, created_at FROM results "
+                f"WHERE kind = ? AND mode = ? AND value_hash IN ({', '.join('?' * len(batch))})"
+            )
+            parameters = [kind, mode, *batch]
+            if cutoff is not None:
+                query += " AND created_at >= ?"
+                parameters.append(cutoff)
+            rows.extend(self._connection.execute(query, parameters))
+        return rows
+
+    def _remember(self, key: tuple, result, created_at: float) -> None:
+        """
+        Keeps a result in memory, dropping the least recently used one when full.
+        """
+        self._recent_results[key] = (result, created_at)
+        self._recent_results.move_to_end(key)
+        if len(self._recent_results) > self._memory_limit:
+            self._recent_results.popitem(last=False)
+
+    def _forget(self, deleted_rows: list[tuple]) -> None:
+        """
+        Drops deleted (kind, mode, value_hash) rows from memory and from the running count.
+        """
+        self._count = max(self._count - len(deleted_rows), 0)
+        for key in deleted_rows:
+            self._recent_results.pop(key, None)
+
+    def _mode(self, kind: str, options: dict) -> str:
+        """
+        Builds a canonical string from the validator's options, defaults included.
+        """
+        if kind not in VALIDATORS:
+            raise ValueError(f"Unknown kind: '{kind}'. Available kinds are {', '.join(VALIDATORS)}.")
+
+        arguments = inspect.signature(VALIDATORS[kind]).bind("", **options)
+        arguments.apply_defaults()
+        return ",".join(f"{name}={value!r}" for name, value in list(arguments.arguments.items())[1:])
+
+    def _hash_all(self, values: list[str]) -> list[bytes]:
+        if not all(isinstance(value, str) for value in values):
+            raise TypeError("Every item in 'values' must be a string.")
+        blake2b = hashlib.blake2b
+        return [blake2b(value.encode('utf-8', 'surrogatepass'), digest_size=16).digest() for value in values]
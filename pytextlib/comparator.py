@@ -0,0 +1,295 @@
+import math
+
+# --- Cost Limits ---
+# A sub-problem of N words is searched up to max(MIN_COST_LIMIT, sqrt(N))
+# steps deep before it is split at the furthest point reached instead.
+MIN_COST_LIMIT = 256
+
+# Once about this much search work per word has been spent on a diff, the
+# remaining sub-problems are only searched EXHAUSTED_COST_LIMIT steps deep,
+# which keeps the total work linear in the document length.
+WORK_PER_WORD = 16
+EXHAUSTED_COST_LIMIT = 16
+
+
+def find_string_diff(old_string: str, new_string: str) -> list[tuple[str, int, int, int, int]]:
+    """
+    Identifies the word-level differences between two strings.
+
+    Both strings are split on whitespace and compared word by word using
+    Myers' O(ND) difference algorithm in its linear-space form. Words are
+    mapped to integers before comparison, words found on only one side are
+    set aside, and common leading and trailing words are skipped before the
+    search starts, so near-identical documents are compared in close to
+    linear time.
+
+    The search is capped so that heavily edited or unrelated documents also
+    finish quickly: a sub-problem that needs more than max(256, sqrt(N))
+    steps is split at the furthest point reached, and once about 16 steps
+    per word have been spent, remaining sub-problems are only searched 16
+    steps deep. The opcodes are then still a correct edit script, but not
+    necessarily the shortest one. Small or lightly edited inputs always get
+    a shortest edit script.
+
+    Instead of copying words into the result, the differences are described
+    as opcodes over word index ranges, similar to difflib's get_opcodes():
+
+    - ('equal', i1, i2, j1, j2): old_words[i1:i2] == new_words[j1:j2]
+    - ('delete', i1, i2, j1, j1): old_words[i1:i2] is removed
+    - ('insert', i1, i1, j1, j2): new_words[j1:j2] is added
+
+    where old_words and new_words are old_string.split() and new_string.split().
+
+    Args:
+        old_string (str): The original text.
+        new_string (str): The modified text.
+
+    Returns:
+        list[tuple[str, int, int, int, int]]: The opcodes, in order.
+
+    Raises:
+        TypeError: If either input is not a string.
+
+    Examples:
+        >>> find_string_diff("the quick brown fox", "the slow brown fox jumps")
+        [('equal', 0, 1, 0, 1), ('delete', 1, 2, 1, 1), ('insert', 2, 2, 1, 2), ('equal', 2, 4, 2, 4), ('insert', 4, 4, 4, 5)]
+    """
+    # --- Input Validation ---
+    if not isinstance(old_string, str):
+        raise TypeError("Input 'old_string' must be a string.")
+    if not isinstance(new_string, str):
+        raise TypeError("Input 'new_string' must be a string.")
+
+    # --- Core Logic ---
+    word_ids = {}
+    old_ids = [word_ids.setdefault(word, len(word_ids)) for word in old_string.split()]
+    new_ids = [word_ids.setdefault(word, len(word_ids)) for word in new_string.split()]
+
+    # Words that occur on one side only can never be matched, so they are
+    # dropped before the search and restored as plain deletes and inserts.
+    common_ids = set(old_ids).intersection(new_ids)
+    old_keep = [index for index, word_id in enumerate(old_ids) if word_id in common_ids]
+    new_keep = [index for index, word_id in enumerate(new_ids) if word_id in common_ids]
+    if len(old_keep) == len(old_ids) and len(new_keep) == len(new_ids):
+        return _diff_ids(old_ids, new_ids)
+
+    filtered_opcodes = _diff_ids([old_ids[index] for index in old_keep], [new_ids[index] for index in new_keep])
+
+    opcodes = []
+    old_pos = new_pos = 0
+    for tag, i1, i2, j1, _ in filtered_opcodes:
+        if tag != 'equal':
+            continue
+        for offset in range(i2 - i1):
+            old_index = old_keep[i1 + offset]
+            new_index = new_keep[j1 + offset]
+            if old_index > old_pos:
+                _append_opcode(opcodes, ('delete', old_pos, old_index, new_pos, new_pos))
+            if new_index > new_pos:
+                _append_opcode(opcodes, ('insert', old_index, old_index, new_pos, new_index))
+            _append_opcode(opcodes, ('equal', old_index, old_index + 1, new_index, new_index + 1))
+            old_pos, new_pos = old_index + 1, new_index + 1
+
+    if len(old_ids) > old_pos:
+        _append_opcode(opcodes, ('delete', old_pos, len(old_ids), new_pos, new_pos))
+    if len(new_ids) > new_pos:
+        _append_opcode(opcodes, ('insert', len(old_ids), len(old_ids), new_pos, len(new_ids)))
+
+    return opcodes
+
+
+def _diff_ids(old_ids: list[int], new_ids: list[int]) -> list[tuple[str, int, int, int, int]]:
+    """
+    Computes the opcodes between two sequences of word ids.
+
+    Common prefixes and suffixes are trimmed from every sub-range before it is
+    bisected, and an explicit stack keeps deep splits from hitting the
+    recursion limit.
+    """
+    work_budget = max(WORK_PER_WORD * (len(old_ids) + len(new_ids)), MIN_COST_LIMIT ** 2)
+
+    opcodes = []
+    # Each entry is either a pending range (a_lo, a_hi, b_lo, b_hi) or an
+    # opcode that must be emitted once everything above it has been handled.
+    stack = [(0, len(old_ids), 0, len(new_ids))]
+    while stack:
+        item = stack.pop()
+        if isinstance(item[0], str):
+            _append_opcode(opcodes, item)
+            continue
+
+        a_lo, a_hi, b_lo, b_hi = item
+
+        # Fast path: trim the common prefix and suffix.
+        start_a, start_b = a_lo, b_lo
+        while a_lo < a_hi and b_lo < b_hi and old_ids[a_lo] == new_ids[b_lo]:
+            a_lo += 1
+            b_lo += 1
+        if a_lo > start_a:
+            _append_opcode(opcodes, ('equal', start_a, a_lo, start_b, b_lo))
+
+        end_a, end_b = a_hi, b_hi
+        while a_lo < a_hi and b_lo < b_hi and old_ids[a_hi - 1] == new_ids[b_hi - 1]:
+            a_hi -= 1
+            b_hi -= 1
+        if a_hi < end_a:
+            stack.append(('equal', a_hi, end_a, b_hi, end_b))
+
+        if a_lo == a_hi and b_lo == b_hi:
+            continue
+        if a_lo == a_hi:
+            _append_opcode(opcodes, ('insert', a_lo, a_lo, b_lo, b_hi))
+            continue
+        if b_lo == b_hi:
+            _append_opcode(opcodes, ('delete', a_lo, a_hi, b_lo, b_lo))
+            continue
+
+        if work_budget > 0:
+            cost_limit = max(MIN_COST_LIMIT, math.isqrt(a_hi - a_lo + b_hi - b_lo))
+        else:
+            cost_limit = EXHAUSTED_COST_LIMIT
+        split, depth = _bisect(old_ids, a_lo, a_hi, new_ids, b_lo, b_hi, cost_limit)
+        work_budget -= (depth + 1) ** 2
+        if split is None:
+            _append_opcode(opcodes, ('delete', a_lo, a_hi, b_lo, b_lo))
+            _append_opcode(opcodes, ('insert', a_hi, a_hi, b_lo, b_hi))
+            continue
+
+        split_a, split_b = split
+        stack.append((split_a, a_hi, split_b, b_hi))
+        stack.append((a_lo, split_a, b_lo, split_b))
+
+    return opcodes
+
+
+def _append_opcode(opcodes: list, opcode: tuple) -> None:
+    """
+    Appends an opcode, merging it into the previous one when both share a tag.
+    """
+    if opcodes and opcodes[-1][0] == opcode[0]:
+        tag, i1, _, j1, _ = opcodes[-1]
+        opcodes[-1] = (tag, i1, opcode[2], j1, opcode[4])
+    else:
+        opcodes.append(opcode)
+
+
+def _bisect(
+    a: list[int], a_lo: int, a_hi: int, b: list[int], b_lo: int, b_hi: int, cost_limit: int
+) -> tuple[tuple[int, int] | None, int]:
+    """
+    Finds a point on a shortest edit path between a[a_lo:a_hi] and b[b_lo:b_hi].
+
+    Runs the forward and reverse searches of Myers' algorithm at the same time
+    and stops where they overlap, keeping only two diagonal arrays in memory.
+    If they have not met after 'cost_limit' steps, the furthest point reached
+    is used instead, which lies on an edit path that may not be the shortest.
+
+    Returns:
+        tuple[tuple[int, int] | None, int]: Absolute indices (in a, in b) at
+        which the problem can be split in two, or None if it cannot be split,
+        and the number of steps searched.
+    """
+    a_len = a_hi - a_lo
+    b_len = b_hi - b_lo
+    max_d = (a_len + b_len + 1) // 2
+    v_offset = min(max_d, cost_limit + 1)
+    v_length = 2 * v_offset + 2
+    forward = [-1] * v_length
+    forward[v_offset + 1] = 0
+    reverse = forward[:]
+    delta = a_len - b_len
+    # With an odd delta the paths meet during a forward step, otherwise during a reverse one.
+    front = delta % 2 != 0
+
+    k1_start = k1_end = k2_start = k2_end = 0
+    for d in range(max_d):
+        if d > cost_limit:
+            split = _furthest_split(
+                forward, reverse, v_offset, d - 1, (k1_start, k1_end, k2_start, k2_end), a_lo, a_len, b_lo, b_len
+            )
+            return split, d
+
+        # --- Forward search ---
+        for k1 in range(-d + k1_start, d + 1 - k1_end, 2):
+            k1_offset = v_offset + k1
+            if k1 == -d or (k1 != d and forward[k1_offset - 1] < forward[k1_offset + 1]):
+                x1 = forward[k1_offset + 1]
+            else:
+                x1 = forward[k1_offset - 1] + 1
+            y1 = x1 - k1
+            while x1 < a_len and y1 < b_len and a[a_lo + x1] == b[b_lo + y1]:
+                x1 += 1
+                y1 += 1
+            forward[k1_offset] = x1
+
+            if x1 > a_len:
+                k1_end += 2
+            elif y1 > b_len:
+                k1_start += 2
+            elif front:
+                k2_offset = v_offset + delta - k1
+                if 0 <= k2_offset < v_length and reverse[k2_offset] != -1:
+                    if x1 >= a_len - reverse[k2_offset]:
+                        return (a_lo + x1, b_lo + y1), d
+
+        # --- Reverse search ---
+        for k2 in range(-d + k2_start, d + 1 - k2_end, 2):
+            k2_offset = v_offset + k2
+            if k2 == -d or (k2 != d and reverse[k2_offset - 1] < reverse[k2_offset + 1]):
+                x2 = reverse[k2_offset + 1]
+            else:
+                x2 = reverse[k2_offset - 1] + 1
+            y2 = x2 - k2
+            while x2 < a_len and y2 < b_len and a[a_hi - 1 - x2] == b[b_hi - 1 - y2]:
+                x2 += 1
+                y2 += 1
+            reverse[k2_offset] = x2
+
+            if x2 > a_len:
+                k2_end += 2
+            elif y2 > b_len:
+                k2_start += 2
+            elif not front:
+                k1_offset = v_offset + delta - k2
+                if 0 <= k1_offset < v_length and forward[k1_offset] != -1:
+                    x1 = forward[k1_offset]
+                    y1 = v_offset + x1 - k1_offset
+                    if x1 >= a_len - x2:
+                        return (a_lo + x1, b_lo + y1), d
+
+    return None, max_d
+
+
+def _furthest_split(
+    forward: list[int], reverse: list[int], v_offset: int, d: int, trims: tuple[int, int, int, int],
+    a_lo: int, a_len: int, b_lo: int, b_len: int
+) -> tuple[int, int] | None:
+    """
+    Picks the point furthest from its own corner reached by either search after d steps.
+
+    Used once the search gets too expensive, in the spirit of GNU diff's
+    TOO_EXPENSIVE heuristic: the point lies on some edit path but not
+    necessarily a shortest one.
+    """
+    k1_start, k1_end, k2_start, k2_end = trims
+    best_progress = 0
+    best_split = None
+
+    for k1 in range(-d + k1_start, d + 1 - k1_end, 2):
+        x1 = forward[v_offset + k1]
+        y1 = x1 - k1
+        if 0 <= x1 <= a_len and 0 <= y1 <= b_len and x1 + y1 > best_progress:
+            best_progress = x1 + y1
+            best_split = (x1, y1)
+
+    for k2 in range(-d + k2_start, d + 1 - k2_end, 2):
+        x2 = reverse[v_offset + k2]
+        y2 = x2 - k2
+        if 0 <= x2 <= a_len and 0 <= y2 <= b_len and x2 + y2 > best_progress:
+            best_progress = x2 + y2
+            best_split = (a_len - x2, b_len - y2)
+
+    # A split at either corner would not make the problem any smaller.
+    if best_split is None or best_split in ((0, 0), (a_len, b_len)):
+        return None
+    return a_lo + best_split[0], b_lo + best_split[1]
@@ -0,0 +1,347 @@
+import hashlib
+import json
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows.
+    fcntl = None
+
+from .extractor import extract_emails
+from .formatter import remove_lines_containing
+from .parser import parse_csv
+
+# The number of leading bytes hashed to recognise a file that was replaced
+# or rewritten in place.
+HEAD_FINGERPRINT_SIZE = 4096
+
+
+class IncrementalSource:
+    """
+    Reads only the data appended to a file since the last committed run.
+
+    A checkpoint for the file is kept in a JSON file, which can hold the
+    checkpoints of many sources at once. Checkpoints are keyed by path only,
+    so use a separate checkpoint file for each kind of processing applied to
+    the same source. A checkpoint records:
+
+    - the byte offset just past the last complete line that was processed,
+    - the file identity (device and inode numbers),
+    - a hash of the file's first bytes, and
+    - the header line, for CSV sources.
+
+    Only complete lines are returned. A partially written last line stays
+    after the checkpoint offset and is returned by the next run once its line
+    break has been written.
+
+    If the file at 'path' has a different identity than the checkpoint, it is
+    treated as rotated and the new file is read from byte zero. The rotated
+    file keeps its own checkpoint and is looked up by identity in the same
+    directory (e.g. 'app.log' renamed to 'app.log.1'). Its complete lines are
+    returned before those of the new file, on this run and on later runs, as
+    long as it keeps growing: a writer may still append to it until it
+    reopens 'path'. Once a run finds that it has not grown since the previous
+    run, an unfinished last line is returned as a complete line and its
+    checkpoint is dropped; anything written to it after that is not read. If
+    the rotated file cannot be found there (moved elsewhere, compressed or
+    deleted), its unread tail is dropped.
+
+    If the file is shorter than the saved offset (truncated) or starts with
+    different bytes (rewritten in place), it is read again from byte zero.
+    Lines written after the last run but before the truncation are dropped,
+    so copy-and-truncate rotation can lose the tail of the old data.
+
+    After read_new(), 'offset' holds the byte offset in the current file the
+    new text starts at, and 'header' holds the current file's header line.
+
+    Call commit() only after the returned text was processed successfully, so
+    a failed run is retried from the same checkpoint.
+
+    Several processes can share one checkpoint file for different sources:
+    commit() holds a lock on '<checkpoint_path>.lock' while it updates the
+    file, so no commit overwrites another. The lock needs fcntl, so on
+    systems without it (Windows) use one checkpoint file per process.
+
+    Args:
+        path (str): The append-only file to read.
+        checkpoint_path (str): The JSON file storing checkpoints.
+        encoding (str, optional): The file's encoding. It must encode '\\n'
+                                  as a single byte. Defaults to 'utf-8'.
+        has_header (bool, optional): If True, the first non-blank line is
+                                     the header. It is kept in 'header' and
+                                     never returned as new text. Defaults to False.
+
+    Examples:
+        >>> source = IncrementalSource("app.log", "checkpoints.json")
+        >>> new_text = source.read_new()
+        >>> # ... process new_text ...
+        >>> source.commit()
+    """
+
+    def __init__(self, path: str, checkpoint_path: str, encoding: str = 'utf-8', has_header: bool = False):
+        self.path = os.path.abspath(path)
+        self.checkpoint_path = checkpoint_path
+        self.encoding = encoding
+        self.has_header = has_header
+        self.header = None
+        self.offset = 0
+        self._pending_state = None
+
+    def read_new(self) -> str:
+        """
+        Returns the complete lines appended since the last committed checkpoint.
+
+        Returns:
+            str: The new text, ending with a line break, or '' if nothing new.
+        """
+        return "".join(text for _, text in self.read_new_segments())
+
+    def read_new_segments(self) -> list[tuple[str | None, str]]:
+        """
+        Returns the new lines per file, with the header line of each file.
+
+        There is one segment for each rotated file still being read, oldest
+        first, then one for the current file. The header is None unless
+        'has_header' is set.
+
+        Returns:
+            list[tuple[str | None, str]]: (header, text) pairs, in file order.
+        """
+        state = self._load_checkpoints().get(self.path)
+        rotated_states = state.pop("rotated", []) if state is not None else []
+        segments = []
+
+        with open(self.path, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            if state is not None and (stat.st_dev, stat.st_ino) != (state["device"], state["inode"]):
+                rotated_states.append(state)
+                state = None
+            elif state is not None and not self._is_same_file(file, stat, state):
+                state = None
+
+            pending_rotated_states = []
+            for rotated_state in rotated_states:
+                text, rotated_state = self._read_rotated(rotated_state)
+                if text:
+                    segments.append((rotated_state["header"], text))
+                if "size" in rotated_state:
+                    pending_rotated_states.append(rotated_state)
+
+            offset = state["offset"] if state is not None else 0
+            header = state["header"] if state is not None else None
+            if self.has_header and header is None:
+                header, offset = self._read_header(file)
+
+            data = b""
+            if header is not None or not self.has_header:
+                file.seek(offset)
+                data = file.read(max(stat.st_size - offset, 0))
+                data = data[:data.rfind(b"\n") + 1]
+            new_offset = offset + len(data)
+
+            file.seek(0)
+            head = file.read(min(HEAD_FINGERPRINT_SIZE, new_offset))
+
+        self.offset = offset
+        self.header = header
+        self._pending_state = {
+            "offset": new_offset,
+            "device": stat.st_dev,
+            "inode": stat.st_ino,
+            "head_size": len(head),
+            "head_hash": hashlib.blake2b(head, digest_size=16).hexdigest(),
+            "header": header,
+            "rotated": pending_rotated_states,
+        }
+        segments.append((header, data.decode(self.encoding)))
+        return segments
+
+    def commit(self) -> None:
+        """
+        Saves the checkpoint reached by the last read_new() call.
+
+        Raises:
+            ValueError: If read_new() has not been called since the last commit.
+        """
+        if self._pending_state is None:
+            raise ValueError("Nothing to commit. Call read_new() first.")
+
+        with open(f"{self.checkpoint_path}.lock", 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+
+            checkpoints = self._load_checkpoints()
+            checkpoints[self.path] = self._pending_state
+
+            # Write to a temporary file first so a crash never leaves a torn checkpoint.
+            with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=os.path.dirname(os.path.abspath(self.checkpoint_path)), delete=False
+            ) as file:
+                json.dump(checkpoints, file, indent=2)
+            try:
+                os.replace(file.name, self.checkpoint_path)
+            except OSError:
+                os.remove(file.name)
+                raise
+        self._pending_state = None
+
+    def _load_checkpoints(self) -> dict:
+        try:
+            with open(self.checkpoint_path, encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def _is_same_file(self, file, stat: os.stat_result, state: dict) -> bool:
+        if (stat.st_dev, stat.st_ino) != (state["device"], state["inode"]):
+            return False
+        if stat.st_size < state["offset"]:
+            return False
+
+        file.seek(0)
+        head = file.read(state["head_size"])
+        return hashlib.blake2b(head, digest_size=16).hexdigest() == state["head_hash"]
+
+    def _read_rotated(self, state: dict) -> tuple[str, dict]:
+        """
+        Reads the new complete lines of a rotated file.
+
+        Returns:
+            tuple[str, dict]: The new text and the file's updated checkpoint,
+            which has no 'size' once the file is finished with.
+        """
+        rotated_path = self._find_rotated_file(state)
+        if rotated_path is None:
+            return "", {"header": state["header"]}
+
+        with open(rotated_path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            file.seek(state["offset"])
+            data = file.read(max(size - state["offset"], 0))
+
+        if size == state.get("size"):
+            # Nothing was written since the last run, so the writer has moved
+            # on and an unfinished last line will never be completed.
+            text = data.decode(self.encoding)
+            if text and not text.endswith("\n"):
+                text += "\n"
+            return text, {"header": state["header"]}
+
+        data = data[:data.rfind(b"\n") + 1]
+        return data.decode(self.encoding), {**state, "offset": state["offset"] + len(data), "size": size}
+
+    def _find_rotated_file(self, state: dict) -> str | None:
+        """
+        Finds the file with the checkpointed identity next to 'path'.
+        """
+        for entry in os.scandir(os.path.dirname(self.path)):
+            if entry.path == self.path or not entry.is_file():
+                continue
+            entry_stat = entry.stat()
+            if (entry_stat.st_dev, entry_stat.st_ino) != (state["device"], state["inode"]):
+                continue
+            with open(entry.path, 'rb') as file:
+                if self._is_same_file(file, os.fstat(file.fileno()), state):
+                    return entry.path
+        return None
+
+    def _read_header(self, file) -> tuple[str | None, int]:
+        """
+        Finds the first non-blank complete line, the way parse_csv() picks its header.
+
+        Returns:
+            tuple[str | None, int]: The header without leading whitespace and
+            the offset just past it, or (None, 0) if there is none yet.
+        """
+        file.seek(0)
+        offset = 0
+        for raw_line in file:
+            if not raw_line.endswith(b"\n"):
+                break
+            offset += len(raw_line)
+            line = raw_line.decode(self.encoding)
+            if line.strip():
+                return line.lstrip().rstrip("\r\n"), offset
+        return None, 0
+
+
+def incremental_remove_lines_containing(path: str, target: str, checkpoint_path: str, encoding: str = 'utf-8') -> str:
+    """
+    Applies remove_lines_containing() to the lines appended since the last run.
+
+    Args:
+        path (str): The append-only file to read.
+        target (str): Lines containing this substring are dropped.
+        checkpoint_path (str): The JSON file storing checkpoints.
+        encoding (str, optional): The file's encoding. Defaults to 'utf-8'.
+
+    Returns:
+        str: The new lines that do not contain the target, joined with '\\n'.
+
+    Raises:
+        TypeError: If 'target' is not a string.
+    """
+    # --- Input Validation ---
+    if not isinstance(target, str):
+        raise TypeError("Input 'target' must be a string")
+
+    # --- Core Logic ---
+    source = IncrementalSource(path, checkpoint_path, encoding)
+    result = remove_lines_containing(source.read_new(), target)
+    source.commit()
+    return result
+
+
+def incremental_extract_emails(path: str, checkpoint_path: str, mode: str = "default", encoding: str = 'utf-8') -> list[str]:
+    """
+    Applies extract_emails() to the lines appended since the last run.
+
+    Args:
+        path (str): The append-only file to read.
+        checkpoint_path (str): The JSON file storing checkpoints.
+        mode (str, optional): 'default' or 'rfc5322'. Defaults to 'default'.
+        encoding (str, optional): The file's encoding. Defaults to 'utf-8'.
+
+    Returns:
+        list[str]: The email addresses found in the new lines.
+
+    Raises:
+        ValueError: If an unknown mode is specified.
+    """
+    source = IncrementalSource(path, checkpoint_path, encoding)
+    result = extract_emails(source.read_new(), mode)
+    source.commit()
+    return result
+
+
+def incremental_parse_csv(path: str, checkpoint_path: str, separator: str = ',', encoding: str = 'utf-8') -> list[dict]:
+    """
+    Applies parse_csv() to the rows appended since the last run.
+
+    The header row (the first non-blank line) is read once and remembered in
+    the checkpoint, so later runs parse the new rows with the same column
+    names. After a rotation, the rest of the rotated file is parsed with its
+    own header and the new file with its own.
+
+    Args:
+        path (str): The append-only CSV file to read.
+        checkpoint_path (str): The JSON file storing checkpoints.
+        separator (str, optional): The delimiter for separating columns. Defaults to ','.
+        encoding (str, optional): The file's encoding. Defaults to 'utf-8'.
+
+    Returns:
+        list[dict]: The new rows.
+    """
+    source = IncrementalSource(path, checkpoint_path, encoding, has_header=True)
+    segments = source.read_new_segments()
+
+    result = []
+    for header, text in segments:
+        if header is not None:
+            result.extend(parse_csv(f"{header}\n{text}", separator))
+
+    # Without a header there is nothing to resume from yet, unless rotated files are being read.
+    if source.header is not None or len(segments) > 1 or source._pending_state["rotated"]:
+        source.commit()
+    return result
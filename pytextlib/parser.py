@@ -1,20 +1,245 @@
-def parse_csv(input_string: str, separator: str = ',') -> list[dict]:
+import re
+import struct
+import sys
+import tempfile
+from array import array
+
+# --- Patterns ---
+# The same boundaries str.splitlines() uses, matched lazily.
+LINE_BREAK_PATTERN = re.compile(r"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+VALUE_LENGTH = struct.Struct('<I')
+
+
+class CsvTable:
+    """
+    A table of parsed CSV rows that stays within a memory budget.
+
+    Rows are kept in memory until their estimated size exceeds 'memory_limit'
+    bytes. The buffered rows are then written as one batch to an anonymous
+    temporary file, using a length-prefixed binary format, and the buffer
+    starts over. Only an 8-byte file offset per spilled row stays in memory.
+
+    Spilled and in-memory rows look the same from the outside: the table
+    supports len(), iteration and indexing, and every row is returned as a
+    new dictionary keyed by the header names.
+
+    Use the table as a context manager, or call close(), to delete the
+    temporary file as soon as it is no longer needed.
+
+    Args:
+        headers (list[str]): The column names.
+        memory_limit (int): The maximum estimated size, in bytes, of the rows
+                            held in memory.
+    """
+
+    def __init__(self, headers: list[str], memory_limit: int):
+        self.headers = headers
+        self._memory_limit = memory_limit
+        self._rows = []
+        self._rows_size = 0
+        self._spill_file = None
+        self._spill_offsets = array('q')
+        self._spill_size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._spill_offsets) + len(self._rows)
+
+    def __iter__(self):
+        batch_size = max(self._memory_limit, 1)
+        spilled_count = len(self._spill_offsets)
+
+        index = 0
+        while index < spilled_count:
+            # Read as many rows as fit in one budget-sized batch, at least one.
+            start = self._spill_offsets[index]
+            end_index = index + 1
+            while end_index < spilled_count and self._spill_offsets[end_index] - start < batch_size:
+                end_index += 1
+            end = self._spill_offsets[end_index] if end_index < spilled_count else self._spill_size
+
+            data = self._read_spilled(start, end)
+            for row_index in range(index, end_index):
+                row_start = self._spill_offsets[row_index] - start
+                row_end = self._spill_offsets[row_index + 1] - start if row_index + 1 < spilled_count else len(data)
+                yield self._to_dict(self._decode_values(data[row_start:row_end]))
+            index = end_index
+
+        for values in list(self._rows):
+            yield self._to_dict(values)
+
+    def __getitem__(self, index: int | slice) -> dict | list[dict]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if not isinstance(index, int):
+            raise TypeError("Table indices must be integers or slices.")
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Table index out of range.")
+
+        spilled_count = len(self._spill_offsets)
+        if index >= spilled_count:
+            return self._to_dict(self._rows[index - spilled_count])
+
+        start = self._spill_offsets[index]
+        end = self._spill_offsets[index + 1] if index + 1 < spilled_count else self._spill_size
+        return self._to_dict(self._decode_values(self._read_spilled(start, end)))
+
+    @property
+    def spilled(self) -> bool:
+        """
+        True if any rows have been written to disk.
+        """
+        return self._spill_file is not None
+
+    def close(self) -> None:
+        """
+        Deletes the temporary file. Rows that were spilled are no longer available.
+        """
+        if self._spill_file is not None:
+            self._spill_file.close()
+
+    def _append(self, values: list[str]) -> None:
+        self._rows.append(tuple(values))
+        self._rows_size += sys.getsizeof(self._rows[-1]) + sum(sys.getsizeof(value) for value in values)
+        if self._rows_size > self._memory_limit:
+            self._spill()
+
+    def _spill(self) -> None:
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile()
+
+        self._spill_file.seek(self._spill_size)
+        records = []
+        for values in self._rows:
+            self._spill_offsets.append(self._spill_size)
+            record = b"".join(
+                VALUE_LENGTH.pack(len(encoded)) + encoded
+                for encoded in (value.encode('utf-8', 'surrogatepass') for value in values)
+            )
+            records.append(record)
+            self._spill_size += len(record)
+
+        self._spill_file.write(b"".join(records))
+        self._rows = []
+        self._rows_size = 0
+
+    def _read_spilled(self, start: int, end: int) -> bytes:
+        if self._spill_file.closed:
+            raise ValueError("The table has been closed.")
+        self._spill_file.seek(start)
+        return self._spill_file.read(end - start)
+
+    def _decode_values(self, record: bytes) -> list[str]:
+        values = []
+        position = 0
+        while position < len(record):
+            (length,) = VALUE_LENGTH.unpack_from(record, position)
+            position += VALUE_LENGTH.size
+            values.append(record[position:position + length].decode('utf-8', 'surrogatepass'))
+            position += length
+        return values
+
+    def _to_dict(self, values: tuple | list) -> dict:
+        return dict(zip(self.headers, values))
+
+
+def _iter_lines(input_string: str):
+    """
+    Yields the same lines as input_string.splitlines() without building a list.
+    """
+    position = 0
+    for match in LINE_BREAK_PATTERN.finditer(input_string):
+        yield input_string[position:match.start()]
+        position = match.end()
+    if position < len(input_string):
+        yield input_string[position:]
+
+
+def _iter_stripped_lines(input_string: str):
+    """
+    Yields the same lines as input_string.strip().splitlines() without copying the input.
+    """
+    pending = []
+    for line in _iter_lines(input_string):
+        if not line.strip():
+            # Blank lines only count once a non-blank line follows them.
+            if pending:
+                pending.append(line)
+            continue
+        if pending:
+            yield from pending
+        else:
+            line = line.lstrip()
+        pending = [line]
+    if pending:
+        yield pending[0].rstrip()
+
+
+def _parse_csv_table(input_string: str, separator: str, memory_limit: int) -> CsvTable:
+    lines = _iter_stripped_lines(input_string)
+
+    header_list = []
+    for header in next(lines, "").split(separator):
+        header_list.append(header.strip())
+
+    result_table = CsvTable(header_list, memory_limit)
+    for row_string in lines:
+        values_list = []
+        for value in row_string.split(separator):
+            values_list.append(value.strip())
+
+        if len(header_list) == len(values_list):
+            result_table._append(values_list)
+
+    return result_table
+
+
+def parse_csv(input_string: str, separator: str = ',', memory_limit: int | None = None) -> list[dict] | CsvTable:
     """
     Parses a CSV formatted string into a list of dictionaries.
 
     The first line of the CSV string is expected to be the header row.
 
+    If 'memory_limit' is given, the rows are collected in a CsvTable instead,
+    which writes batches of rows to a temporary file whenever the rows held
+    in memory would exceed that many bytes. The input is then split into lines
+    one at a time without being copied, so peak memory stays close to the
+    input string plus the budget, plus an 8-byte file offset per spilled row.
+
     Args:
         input_string (str): The string containing CSV data.
         separator (str, optional): The delimiter for separating columns. Defaults to ','.
+        memory_limit (int, optional): The memory budget, in bytes, for parsed rows.
+                                      Defaults to None (no limit, returns a list).
 
     Returns:
-        A list of dictionaries, where each dictionary represents a row.
+        A list of dictionaries, where each dictionary represents a row,
+        or a CsvTable of the same rows if 'memory_limit' is given.
+
+    Raises:
+        TypeError: If 'input_string' is not a string or 'memory_limit' is not an integer.
+        ValueError: If 'memory_limit' is not positive.
     """
     # --- Input Validation ---
     if not isinstance(input_string, str):
         raise TypeError("Input 'input_string' must be a string.")
 
+    if memory_limit is not None:
+        if isinstance(memory_limit, bool) or not isinstance(memory_limit, int):
+            raise TypeError("Input 'memory_limit' must be an integer.")
+        if memory_limit <= 0:
+            raise ValueError("Input 'memory_limit' must be positive.")
+        return _parse_csv_table(input_string, separator, memory_limit)
+
     lines = input_string.strip().splitlines()
     if len(lines) < 2:
         return []